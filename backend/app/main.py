@@ -3,6 +3,7 @@
 import logging
 import os
 from contextlib import asynccontextmanager
+from typing import Optional
 
 from app.api.routes import router
 from app.models import init_db
@@ -20,11 +21,6 @@ logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 
-# Get root_path from environment variable
-# This allows the app to work correctly behind reverse proxies or when deployed
-# to cloud platforms with different base paths (e.g., Azure Container Apps)
-root_path = os.getenv("ROOT_PATH", "")
-
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -45,37 +41,59 @@ async def lifespan(app: FastAPI):
     logging.info("Scheduler shut down")
 
 
-# Create FastAPI app
-app = FastAPI(
-    title="hadiscover API",
-    description="Search engine for Home Assistant automations from GitHub",
-    version=__version__,
-    root_path=root_path,
-    lifespan=lifespan,
-)
-
-# Configure CORS for frontend
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["http://localhost:8080", "https://hadiscover.com"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+async def root():
+    """Root endpoint."""
+    return {"message": "hadiscover API", "version": __version__, "docs": "/docs"}
 
-# Determine the API route prefix based on root_path configuration
-# If root_path is already set to /api/v1, don't add it again to routes
-# This allows the app to work correctly when deployed behind reverse proxies
-api_prefix = "" if root_path else "/api/v1"
 
-# Include API routes
-app.include_router(router, prefix=api_prefix)
+def create_app(root_path: Optional[str] = None) -> FastAPI:
+    """
+    Create and configure the FastAPI application.
+
+    Args:
+        root_path: Base path the app is served under. Falls back to the
+            ROOT_PATH environment variable when not provided.
+
+    Returns:
+        Configured FastAPI application
+    """
+    # Get root_path from environment variable
+    # This allows the app to work correctly behind reverse proxies or when deployed
+    # to cloud platforms with different base paths (e.g., Azure Container Apps)
+    if root_path is None:
+        root_path = os.getenv("ROOT_PATH", "")
+
+    application = FastAPI(
+        title="hadiscover API",
+        description="Search engine for Home Assistant automations from GitHub",
+        version=__version__,
+        root_path=root_path,
+        lifespan=lifespan,
+    )
+
+    # Configure CORS for frontend
+    application.add_middleware(
+        CORSMiddleware,
+        allow_origins=["http://localhost:8080", "https://hadiscover.com"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    # Determine the API route prefix based on root_path configuration
+    # If root_path is already set to /api/v1, don't add it again to routes
+    # This allows the app to work correctly when deployed behind reverse proxies
+    api_prefix = "" if root_path else "/api/v1"
+
+    # Include API routes
+    application.include_router(router, prefix=api_prefix)
+    application.add_api_route("/", root, methods=["GET"])
+
+    return application
 
 
-@app.get("/")
-async def root():
-    """Root endpoint."""
-    return {"message": "hadiscover API", "version": __version__, "docs": "/docs"}
+# Create FastAPI app
+app = create_app()
 
 
 if __name__ == "__main__":
@@ -1,10 +1,38 @@
 """Test fixtures and configuration."""
 
+from contextlib import ExitStack
+from unittest.mock import patch
+
 import pytest
+from app.main import create_app
 from app.models.database import Base
+from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
+
+def pytest_configure(config):
+    """Register custom markers."""
+    config.addinivalue_line(
+        "markers",
+        "serial: test touches shared state; deselect with '-m \"not serial\"' "
+        "when running in parallel with pytest-xdist",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip pytest-benchmark tests unless --benchmark-only is given."""
+    if not config.pluginmanager.hasplugin("benchmark"):
+        skip_benchmark = pytest.mark.skip(reason="pytest-benchmark is not loaded")
+    elif config.getoption("benchmark_only", default=False):
+        return
+    else:
+        skip_benchmark = pytest.mark.skip(reason="run with --benchmark-only")
+    for item in items:
+        if "benchmark" in getattr(item, "fixturenames", ()):
+            item.add_marker(skip_benchmark)
+
+
 # Sample Home Assistant automation YAML for testing
 SAMPLE_AUTOMATION_YAML = """
 - alias: "Motion Activated Light"
@@ -71,3 +99,53 @@ def sample_repo_data():
         "url": "https://github.com/testuser/home-assistant-config",
         "default_branch": "main",
     }
+
+
+def _lifespan_client(stack, root_path):
+    """
+    Enter a TestClient for create_app(root_path) with the scheduler stubbed.
+
+    init_db is stubbed too, so parallel xdist workers do not race to create
+    tables in the shared database file. The patches only cover lifespan
+    startup, so they do not leak into other tests. The scheduler stub is
+    exposed as ``scheduler_stub`` on the returned client.
+    """
+    with (
+        patch("app.main.init_db"),
+        patch("app.main.SchedulerService") as scheduler_stub,
+    ):
+        test_client = stack.enter_context(TestClient(create_app(root_path)))
+    test_client.scheduler_stub = scheduler_stub
+    return test_client
+
+
+@pytest.fixture(scope="session")
+def client_no_root():
+    """Session-wide test client for an app without ROOT_PATH."""
+    with ExitStack() as stack:
+        yield _lifespan_client(stack, "")
+
+
+@pytest.fixture(scope="session")
+def client_root_v1():
+    """Session-wide test client for an app with ROOT_PATH set to /api/v1."""
+    with ExitStack() as stack:
+        yield _lifespan_client(stack, "/api/v1")
+
+
+@pytest.fixture
+def client(request):
+    """
+    Resolve a ROOT_PATH variant name ("no_root" or "root_v1") to its client.
+
+    Use with pytest.mark.parametrize(..., indirect=["client"]).
+    """
+    return request.getfixturevalue(f"client_{request.param}")
+
+
+@pytest.fixture(scope="session")
+def openapi_schema(client_root_v1):
+    """OpenAPI schema of the /api/v1 ROOT_PATH app, generated once per session."""
+    response = client_root_v1.get("/openapi.json")
+    assert response.status_code == 200
+    return response.json()
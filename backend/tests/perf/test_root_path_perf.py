@@ -0,0 +1,41 @@
+"""Performance benchmarks for endpoints under each ROOT_PATH configuration."""
+
+import pytest
+
+
+class RootPathScenario:
+    """
+    Benchmark scenario for a single endpoint.
+
+    Setup (client selection and URL building) is kept out of run() so that
+    only the request itself is measured.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.client = None
+        self.url = None
+
+    def setup(self, client, prefix: str):
+        """Prepare the client and URL for the configured variant."""
+        self.client = client
+        self.url = f"{prefix}{self.path}"
+
+    def run(self):
+        """Request the endpoint under test."""
+        return self.client.get(self.url)
+
+
+@pytest.mark.parametrize("path", ["/health", "/statistics", "/search?q=test"])
+@pytest.mark.parametrize(
+    "client,prefix",
+    [("no_root", "/api/v1"), ("root_v1", "")],
+    indirect=["client"],
+)
+def test_endpoint_perf(benchmark, client, prefix, path):
+    """Benchmark an endpoint request without app or client setup."""
+    scenario = RootPathScenario(path)
+    scenario.setup(client, prefix)
+
+    response = benchmark(scenario.run)
+    assert response.status_code == 200
@@ -1,5 +1,6 @@
 """Tests for API endpoints."""
 
+import pytest
 from app.main import app
 from fastapi.testclient import TestClient
 
@@ -58,6 +59,9 @@ def test_statistics_endpoint_structure():
     assert isinstance(data["total_automations"], int)
 
 
+# Starts background indexing that writes to the shared database file, so keep it
+# out of parallel runs.
+@pytest.mark.serial
 def test_index_endpoint():
     """Test index trigger endpoint in development mode."""
     import os
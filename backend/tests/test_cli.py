@@ -23,7 +23,7 @@ def test_db():
 
 
 @pytest.mark.asyncio
-async def test_run_indexing_success(test_db):
+async def test_run_indexing_success(test_db, monkeypatch):
     """Test successful indexing run."""
     # Mock the indexer service
     mock_stats = {
@@ -41,19 +41,14 @@ async def test_run_indexing_success(test_db):
         mock_indexer.index_repositories.return_value = mock_stats
         mock_indexer_class.return_value = mock_indexer
 
-        # Set environment variable
-        os.environ["GITHUB_TOKEN"] = "test_token"
+        # Set environment variable (restored automatically on teardown)
+        monkeypatch.setenv("GITHUB_TOKEN", "test_token")
 
-        try:
-            exit_code = await run_indexing()
-
-            # Verify success
-            assert exit_code == 0
-            mock_indexer.index_repositories.assert_called_once()
-        finally:
-            # Clean up
-            if "GITHUB_TOKEN" in os.environ:
-                del os.environ["GITHUB_TOKEN"]
+        exit_code = await run_indexing()
+
+        # Verify success
+        assert exit_code == 0
+        mock_indexer.index_repositories.assert_called_once()
 
 
 @pytest.mark.asyncio
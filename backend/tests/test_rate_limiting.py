@@ -2,8 +2,13 @@
 
 import os
 
+import pytest
 from fastapi.testclient import TestClient
 
+# These tests POST to /api/v1/index, which starts background indexing that writes
+# to the shared database file, so keep them out of parallel runs.
+pytestmark = pytest.mark.serial
+
 
 def test_index_rate_limiting():
     """Test that the index endpoint enforces rate limiting in development mode."""
@@ -1,113 +1,85 @@
 """Tests for ROOT_PATH environment variable configuration."""
 
-import importlib
-import os
-import sys
-
 import pytest
-from fastapi.testclient import TestClient
+from app.main import create_app
 
 
 @pytest.fixture
-def app_with_root_path():
-    """Fixture that provides an app instance with ROOT_PATH set."""
-    os.environ["ROOT_PATH"] = "/api/v1"
-
-    # Reload the app.main module
-    if "app.main" in sys.modules:
-        importlib.reload(sys.modules["app.main"])
+def fresh_app(monkeypatch, root_path):
+    """Build an app from the ROOT_PATH environment variable, restored on teardown."""
+    if root_path:
+        monkeypatch.setenv("ROOT_PATH", root_path)
     else:
-        import app.main
-
-    from app.main import app
-
-    yield app
+        monkeypatch.delenv("ROOT_PATH", raising=False)
+    return create_app()
 
-    # Cleanup
-    if "ROOT_PATH" in os.environ:
-        del os.environ["ROOT_PATH"]
-    if "app.main" in sys.modules:
-        importlib.reload(sys.modules["app.main"])
 
+@pytest.mark.parametrize("root_path", ["", "/api/v1"])
+def test_create_app_reads_root_path_from_environment(fresh_app, root_path):
+    """Test that create_app falls back to the ROOT_PATH environment variable."""
+    assert fresh_app.root_path == root_path
 
-@pytest.fixture
-def app_without_root_path():
-    """Fixture that provides an app instance without ROOT_PATH set."""
-    if "ROOT_PATH" in os.environ:
-        del os.environ["ROOT_PATH"]
-
-    # Reload the app.main module
-    if "app.main" in sys.modules:
-        importlib.reload(sys.modules["app.main"])
-    else:
-        import app.main
-
-    from app.main import app
 
-    yield app
+def test_create_app_argument_overrides_environment(monkeypatch):
+    """Test that an explicit root_path takes precedence over ROOT_PATH."""
+    monkeypatch.setenv("ROOT_PATH", "/api/v1")
+    assert create_app("").root_path == ""
 
-    # Cleanup
-    if "app.main" in sys.modules:
-        importlib.reload(sys.modules["app.main"])
 
+# Endpoints served under the API prefix and the keys each response must contain
+ENDPOINTS = [
+    ("/health", {"status"}),
+    ("/statistics", {"total_repositories", "total_automations"}),
+    ("/search?q=test", {"query", "results", "count"}),
+]
 
-def test_endpoints_with_root_path_set(app_with_root_path):
-    """Test that endpoints work correctly when ROOT_PATH is set to /api/v1."""
-    client = TestClient(app_with_root_path)
 
-    # When ROOT_PATH=/api/v1, endpoints should be accessible without the prefix
-    response = client.get("/health")
-    assert response.status_code == 200
-    assert response.json() == {"status": "healthy"}
-
-    response = client.get("/statistics")
-    assert response.status_code == 200
-    data = response.json()
-    assert "total_repositories" in data
-    assert "total_automations" in data
-
-    response = client.get("/search?q=test")
+def _check(client, path, required_keys):
+    """Assert that a GET request succeeds and returns the required keys."""
+    response = client.get(path)
     assert response.status_code == 200
     data = response.json()
-    assert "query" in data
-    assert "results" in data
-    assert "count" in data
-
-
-def test_endpoints_without_root_path(app_without_root_path):
-    """Test that endpoints work correctly when ROOT_PATH is not set (default behavior)."""
-    client = TestClient(app_without_root_path)
-
-    # Without ROOT_PATH, endpoints should require /api/v1 prefix
-    response = client.get("/api/v1/health")
-    assert response.status_code == 200
-    assert response.json() == {"status": "healthy"}
+    assert required_keys <= data.keys()
+    return data
+
+
+@pytest.mark.parametrize(
+    "client,prefix",
+    [
+        # Without ROOT_PATH, endpoints should require the /api/v1 prefix
+        ("no_root", "/api/v1"),
+        # When ROOT_PATH=/api/v1, endpoints should be accessible without the prefix
+        ("root_v1", ""),
+    ],
+    indirect=["client"],
+)
+def test_endpoints_with_root_path(client, prefix):
+    """Test that endpoints are served under the prefix matching ROOT_PATH."""
+    for path, required_keys in ENDPOINTS:
+        data = _check(client, f"{prefix}{path}", required_keys)
+        if path == "/health":
+            assert data == {"status": "healthy"}
+
+
+def test_endpoints_without_root_path_require_prefix(client_no_root):
+    """Test that endpoints are not served without the prefix when ROOT_PATH is unset."""
+    response = client_no_root.get("/health")
+    assert response.status_code == 404
 
-    response = client.get("/api/v1/statistics")
-    assert response.status_code == 200
-    data = response.json()
-    assert "total_repositories" in data
-    assert "total_automations" in data
 
-    response = client.get("/api/v1/search?q=test")
-    assert response.status_code == 200
-    data = response.json()
-    assert "query" in data
-    assert "results" in data
+@pytest.mark.parametrize("client", ["no_root", "root_v1"], indirect=True)
+def test_session_clients_do_not_start_scheduler(client):
+    """Test that the shared clients run the lifespan with the scheduler stubbed."""
+    from app.main import SchedulerService
+    from app.services.scheduler import SchedulerService as RealSchedulerService
 
-    # Without prefix should fail
-    response = client.get("/health")
-    assert response.status_code == 404
+    # The patch only covers lifespan startup and must not leak into later tests
+    assert SchedulerService is RealSchedulerService
+    client.scheduler_stub.return_value.start.assert_called_once()
 
 
-def test_openapi_schema_with_root_path(app_with_root_path):
+def test_openapi_schema_with_root_path(openapi_schema):
     """Test that OpenAPI schema includes correct server URL when ROOT_PATH is set."""
-    client = TestClient(app_with_root_path)
-
-    response = client.get("/openapi.json")
-    assert response.status_code == 200
-
-    openapi_schema = response.json()
     assert "servers" in openapi_schema
     assert len(openapi_schema["servers"]) > 0
     # Check that the root_path is reflected in the server URL